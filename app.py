@@ -1,8 +1,6 @@
-import pickle
 import gradio as gr
-import numpy as np
 import logging
-from typing import Dict, Tuple, Union
+from predictor import ForestFirePredictor, RISK_THRESHOLDS
 
 # Configure logging
 logging.basicConfig(
@@ -11,89 +9,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class ForestFirePredictor:
-    def __init__(self):
-        try:
-            with open("models/ridge.pkl", "rb") as f:
-                self.model = pickle.load(f)
-            with open("models/scaler.pkl", "rb") as f:
-                self.scaler = pickle.load(f)
-            logger.info("Model and scaler loaded successfully.")
-        except Exception as e:
-            logger.error(f"Error loading models: {e}")
-            raise
-
-    def predict(
-        self, Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
-    ) -> Dict[str, Union[str, float]]:
-        try:
-            validation = self._validate_inputs(
-                Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
-            )
-            if validation:
-                return {"error": validation}
-
-            input_data = np.array(
-                [[Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region]]
-            )
-            input_scaled = self.scaler.transform(input_data)
-            prediction = float(self.model.predict(input_scaled)[0])
-            level, color, recommendations = self._get_risk_assessment(prediction)
-
-            return {
-                "prediction": prediction,
-                "risk_level": level,
-                "color": color,
-                "recommendations": recommendations,
-            }
-        except Exception as e:
-            logger.error(f"Prediction error: {e}")
-            return {"error": str(e)}
-
-    def _validate_inputs(
-        self, Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
-    ) -> str:
-        if not (22 <= Temperature <= 42):
-            return "Temperature must be between 22°C and 42°C."
-        if not (21 <= RH <= 90):
-            return "Relative Humidity must be between 21% and 90%."
-        if not (6 <= Ws <= 29):
-            return "Wind Speed must be between 6 and 29 km/h."
-        if not (0 <= Rain <= 16.8):
-            return "Rain must be between 0 and 16.8 mm."
-        if not (28.6 <= FFMC <= 92.5):
-            return "FFMC must be between 28.6 and 92.5."
-        if not (1.1 <= DMC <= 65.9):
-            return "DMC must be between 1.1 and 65.9."
-        if not (0 <= ISI <= 18.5):
-            return "ISI must be between 0 and 18.5."
-        if Classes not in [0, 1]:
-            return "Class must be 0 (No Fire) or 1 (Fire)."
-        if Region not in [0, 1]:
-            return "Region must be 0 (Bejaia) or 1 (Sidi-Bel Abbes)."
-        return ""
-
-    def _get_risk_assessment(self, fwi: float) -> Tuple[str, str, str]:
-        if fwi <= 10:
-            return (
-                "Low Risk",
-                "#d4edd8",  # Slightly deeper green for better contrast
-                "• Regular monitoring recommended<br>• Standard fire prevention measures sufficient<br>• Good conditions for controlled burns if needed",
-            )
-        elif fwi <= 20:
-            return (
-                "Moderate Risk",
-                "#fff0b3",  # Warmer yellow for better visibility
-                "• Enhanced monitoring required<br>• Ensure fire breaks are maintained<br>• Review fire response procedures<br>• Avoid unnecessary burning activities",
-            )
-        else:
-            return (
-                "High Risk Level",
-                "#ffd6d6",  # Slightly warmer red for better appeal
-                "• Constant monitoring required<br>• All burning activities should be prohibited<br>• Emergency response teams should be on standby<br>• Public warning may be necessary<br>• Implement additional fire prevention measures",
-            )
-
-
 def create_interface():
     try:
         predictor = ForestFirePredictor()
@@ -503,8 +418,8 @@ def create_interface():
 
             risk_class = (
                 "low"
-                if result["prediction"] <= 10
-                else "moderate" if result["prediction"] <= 20 else "high"
+                if result["prediction"] <= RISK_THRESHOLDS[0]
+                else "moderate" if result["prediction"] <= RISK_THRESHOLDS[1] else "high"
             )
 
             # Enhanced result HTML with better visual hierarchy and styling
@@ -535,7 +450,8 @@ def create_interface():
             return gr.update(visible=False), gr.update(visible=True, value=html)
 
         # Create an enhanced intro section
-        intro_html = """
+        low, moderate = RISK_THRESHOLDS
+        intro_html = f"""
         <div style="background: linear-gradient(135deg, #e0f7fa 0%, #e0f2f1 100%); padding: 20px; border-radius: 12px; margin-bottom: 25px; 
              box-shadow: 0 4px 12px rgba(0,0,0,0.05); border: 1px solid rgba(0,0,0,0.05);">
             <h3 style="color: #2b5876 !important; font-size: 22px; font-weight: 800 !important; margin-top: 0; margin-bottom: 15px;">About the Fire Weather Index (FWI)</h3>
@@ -549,15 +465,15 @@ def create_interface():
             <div style="display: flex; justify-content: space-between; margin-top: 20px; flex-wrap: wrap;">
                 <div style="background: linear-gradient(135deg, #d4edd8 0%, #c8e6c9 100%); padding: 12px 18px; border-radius: 8px; 
                      text-align: center; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin: 5px; flex-grow: 1; border: 2px solid rgba(255,255,255,0.8);">
-                    <strong style="color: #2e7d32 !important; font-size: 16px; font-weight: 800 !important;">Low Risk (0-10)</strong>
+                    <strong style="color: #2e7d32 !important; font-size: 16px; font-weight: 800 !important;">Low Risk (0-{low})</strong>
                 </div>
                 <div style="background: linear-gradient(135deg, #fff8e1 0%, #fff0b3 100%); padding: 12px 18px; border-radius: 8px; 
                      text-align: center; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin: 5px; flex-grow: 1; border: 2px solid rgba(255,255,255,0.8);">
-                    <strong style="color: #ef6c00 !important; font-size: 16px; font-weight: 800 !important;">Moderate Risk (11-20)</strong>
+                    <strong style="color: #ef6c00 !important; font-size: 16px; font-weight: 800 !important;">Moderate Risk ({low + 1}-{moderate})</strong>
                 </div>
                 <div style="background: linear-gradient(135deg, #ffebee 0%, #ffd6d6 100%); padding: 12px 18px; border-radius: 8px; 
                      text-align: center; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin: 5px; flex-grow: 1; border: 2px solid rgba(255,255,255,0.8);">
-                    <strong style="color: #c62828 !important; font-size: 16px; font-weight: 800 !important;">High Risk (>20)</strong>
+                    <strong style="color: #c62828 !important; font-size: 16px; font-weight: 800 !important;">High Risk (>{moderate})</strong>
                 </div>
             </div>
         </div>
@@ -0,0 +1 @@
+# Keeps the repository root importable when running `pytest` from any directory
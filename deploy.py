@@ -1,36 +1,186 @@
 import os
-from huggingface_hub import HfApi
+import json
+import shutil
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
-token = os.getenv("HF_TOKEN")
-username = os.getenv("HF_USERNAME")  # Add this to .env
-space_name = os.getenv("HF_SPACE_NAME", "forest-fire-prediction")  # Add this to .env
+# Only what the Space needs to serve predictions; README.md carries the Space config
+BUNDLE_FILES = [
+    "app.py",
+    "predictor.py",
+    "results.py",
+    "requirements.txt",
+    "README.md",
+    "models/ridge.pkl",
+    "models/scaler.pkl",
+]
+BUILD_DIR = "build/bundle"
+MANIFEST_NAME = "manifest.json"
+# Remote files that are never deleted even though they are not part of the bundle
+KEEP_REMOTE_FILES = {".gitattributes"}
 
-if not token or not username:
-    raise ValueError("HF_TOKEN and HF_USERNAME environment variables must be set!")
 
-api = HfApi(token=token)
-space_id = f"{username}/{space_name}"
+def file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-try:
-    api.create_repo(
-        repo_id=space_name,
-        repo_type="space",
-        space_sdk="gradio",
-        exist_ok=True
-    )
 
-    api.upload_folder(
-        repo_id=space_id,
-        folder_path=".",
-        repo_type="space",
-        ignore_patterns=["venv/*", ".env", ".git/*", "__pycache__/*", "*.pyc"]
+def build_bundle(src: str = ".", dest: str = BUILD_DIR) -> Dict[str, str]:
+    """Copy the serving files into `dest` and write a content-hash manifest."""
+    src_dir, dest_dir = Path(src), Path(dest)
+    if dest_dir.exists():
+        shutil.rmtree(dest_dir)
+
+    manifest = {}
+    for rel in BUNDLE_FILES:
+        target = dest_dir / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src_dir / rel, target)
+        manifest[rel] = file_hash(target)
+
+    with open(dest_dir / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def diff_manifests(
+    local: Dict[str, str], remote: Dict[str, str]
+) -> Tuple[List[str], List[str]]:
+    changed = sorted(p for p, h in local.items() if remote.get(p) != h)
+    removed = sorted(p for p in remote if p not in local)
+    return changed, removed
+
+
+class DirectoryTarget:
+    """Deploy target backed by a local directory (offline stand-in for the Hub)."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def read_manifest(self) -> Dict[str, str]:
+        manifest = self.path / MANIFEST_NAME
+        if not manifest.exists():
+            return {}
+        with open(manifest) as f:
+            return json.load(f)
+
+    def push(self, bundle_dir: Path, changed: List[str], removed: List[str]):
+        for rel in changed + [MANIFEST_NAME]:
+            target = self.path / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(bundle_dir / rel, target)
+        for rel in removed:
+            (self.path / rel).unlink(missing_ok=True)
+
+
+class HubTarget:
+    """Deploy target backed by a Hugging Face Space."""
+
+    def __init__(self, api, space_id: str):
+        self.api = api
+        self.space_id = space_id
+
+    def read_manifest(self) -> Dict[str, str]:
+        from huggingface_hub import hf_hub_download
+        from huggingface_hub.utils import EntryNotFoundError, LocalEntryNotFoundError
+
+        try:
+            path = hf_hub_download(
+                repo_id=self.space_id,
+                filename=MANIFEST_NAME,
+                repo_type="space",
+                token=self.api.token,
+            )
+        except LocalEntryNotFoundError:
+            # Hub unreachable and nothing cached: never mistake that for a missing manifest
+            raise
+        except EntryNotFoundError:
+            # Space predates manifests (old upload_folder deploys): treat every file as stale
+            # so bundle files are re-uploaded and everything else is deleted
+            files = self.api.list_repo_files(self.space_id, repo_type="space")
+            keep = KEEP_REMOTE_FILES | {MANIFEST_NAME}
+            return {rel: "" for rel in files if rel not in keep}
+        with open(path) as f:
+            return json.load(f)
+
+    def push(self, bundle_dir: Path, changed: List[str], removed: List[str]):
+        from huggingface_hub import CommitOperationAdd, CommitOperationDelete
+
+        operations = [
+            CommitOperationAdd(path_in_repo=rel, path_or_fileobj=str(bundle_dir / rel))
+            for rel in changed + [MANIFEST_NAME]
+        ]
+        operations += [CommitOperationDelete(path_in_repo=rel) for rel in removed]
+        self.api.create_commit(
+            repo_id=self.space_id,
+            repo_type="space",
+            operations=operations,
+            commit_message=f"Deploy: {len(changed)} changed, {len(removed)} removed",
+        )
+
+
+def deploy(target, src: str = ".", build_dir: str = BUILD_DIR) -> Tuple[List[str], List[str]]:
+    """Build the bundle and transfer only the files whose hashes differ from the target."""
+    local = build_bundle(src, build_dir)
+    changed, removed = diff_manifests(local, target.read_manifest())
+    if changed or removed:
+        target.push(Path(build_dir), changed, removed)
+    return changed, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deploy the serving bundle.")
+    parser.add_argument(
+        "--target-dir", help="Sync into a local directory instead of the Hub"
     )
+    args = parser.parse_args()
+
+    if args.target_dir:
+        target = DirectoryTarget(args.target_dir)
+        where = args.target_dir
+    else:
+        from huggingface_hub import HfApi
+
+        token = os.getenv("HF_TOKEN")
+        username = os.getenv("HF_USERNAME")  # Add this to .env
+        space_name = os.getenv("HF_SPACE_NAME", "forest-fire-prediction")  # Add this to .env
+
+        if not token or not username:
+            raise ValueError("HF_TOKEN and HF_USERNAME environment variables must be set!")
+
+        api = HfApi(token=token)
+        space_id = f"{username}/{space_name}"
+        api.create_repo(
+            repo_id=space_name,
+            repo_type="space",
+            space_sdk="gradio",
+            exist_ok=True
+        )
+        target = HubTarget(api, space_id)
+        where = f"https://huggingface.co/spaces/{space_id}"
+
+    try:
+        changed, removed = deploy(target)
+        if not changed and not removed:
+            print(f"✅ Already up to date: {where}")
+        else:
+            for rel in changed:
+                print(f"  ↑ {rel}")
+            for rel in removed:
+                print(f"  ✗ {rel}")
+            print(f"✅ Successfully deployed to: {where}")
 
-    print(f"✅ Successfully deployed to: https://huggingface.co/spaces/{space_id}")
+    except Exception as e:
+        print(f"❌ Error during deployment: {str(e)}")
 
-except Exception as e:
-    print(f"❌ Error during deployment: {str(e)}")
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import time
+import logging
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+from predictor import MODEL_PATH, SCALER_PATH, ForestFirePredictor
+
+logger = logging.getLogger(__name__)
+
+N_FEATURES = 9  # Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
+
+# Per-process predictor, loaded once by the pool initializer
+_predictor = None
+
+
+class SharedArray:
+    """NumPy array backed by a `multiprocessing.shared_memory` block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, shape, dtype, owner: bool):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, shape, dtype=np.float64) -> "SharedArray":
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return cls(shm, shape, dtype, owner=True)
+
+    @classmethod
+    def from_array(cls, data: np.ndarray, dtype=np.float64) -> "SharedArray":
+        shared = cls.create(data.shape, dtype)
+        shared.array[...] = data
+        return shared
+
+    @classmethod
+    def attach(cls, spec: Tuple[str, tuple, str]) -> "SharedArray":
+        name, shape, dtype = spec
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype, owner=False)
+
+    @property
+    def spec(self) -> Tuple[str, tuple, str]:
+        return (self.shm.name, self.shape, self.dtype.str)
+
+    def close(self):
+        # Drop the view first; SharedMemory.close() fails while buffers are exported
+        self.array = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # Views still alive (e.g. in a propagating traceback) pin the buffer; the mapping is freed with them
+            pass
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _init_worker(model_path: str, scaler_path: str):
+    global _predictor
+    _predictor = ForestFirePredictor(model_path, scaler_path)
+
+
+def _score_shard(in_spec, out_spec, start: int, stop: int) -> int:
+    inputs = SharedArray.attach(in_spec)
+    outputs = SharedArray.attach(out_spec)
+    rows = None
+    try:
+        rows = inputs.array[start:stop]
+        outputs.array[start:stop] = _predictor.predict_batch(rows)
+    finally:
+        # Release our view before closing; close() tolerates views held by a traceback
+        rows = None
+        inputs.close()
+        outputs.close()
+    return stop - start
+
+
+def shard_bounds(n_rows: int, n_shards: int) -> List[Tuple[int, int]]:
+    edges = np.linspace(0, n_rows, min(n_shards, n_rows) + 1, dtype=np.int64)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+class ParallelScorer:
+    """Persistent process pool that scores row shards of a shared-memory feature matrix."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        shards_per_worker: int = 4,
+        model_path: str = MODEL_PATH,
+        scaler_path: str = SCALER_PATH,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(model_path, scaler_path),
+        )
+
+    def score_shared(self, inputs: SharedArray, outputs: SharedArray):
+        # Workers write FWI predictions straight into `outputs`; nothing is pickled but the specs
+        n_rows = inputs.shape[0]
+        if inputs.shape[1:] != (N_FEATURES,) or outputs.shape != (n_rows,):
+            raise ValueError(
+                f"Expected inputs of shape (n, {N_FEATURES}) and outputs of shape (n,)."
+            )
+        futures = [
+            self._pool.submit(_score_shard, inputs.spec, outputs.spec, start, stop)
+            for start, stop in shard_bounds(n_rows, self.workers * self.shards_per_worker)
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        features = np.asarray(features)
+        with SharedArray.from_array(features) as inputs, SharedArray.create(
+            (features.shape[0],)
+        ) as outputs:
+            self.score_shared(inputs, outputs)
+            return outputs.array.copy()
+
+    def warmup(self):
+        # Make every worker load the model before timing starts
+        self.score(np.zeros((self.workers * self.shards_per_worker, N_FEATURES)))
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def synthetic_features(n_rows: int, seed: int = 0) -> np.ndarray:
+    # Uniform samples within the ranges accepted by ForestFirePredictor._validate_inputs
+    rng = np.random.default_rng(seed)
+    low = np.array([22, 21, 6, 0, 28.6, 1.1, 0, 0, 0])
+    high = np.array([42, 90, 29, 16.8, 92.5, 65.9, 18.5, 1, 1])
+    features = rng.uniform(low, high, size=(n_rows, N_FEATURES))
+    features[:, 7:] = np.round(features[:, 7:])
+    return features
+
+
+def benchmark(n_rows: int, max_workers: int, repeats: int = 3):
+    """Report throughput and scaling efficiency from 1 to `max_workers` processes."""
+    features = synthetic_features(n_rows)
+    expected = ForestFirePredictor().predict_batch(features)
+    with SharedArray.from_array(features) as inputs, SharedArray.create(
+        (n_rows,)
+    ) as outputs:
+        baseline = None
+        print(f"{'workers':>7} {'seconds':>9} {'rows/s':>12} {'speedup':>8} {'efficiency':>10}")
+        for workers in range(1, max_workers + 1):
+            with ParallelScorer(workers) as scorer:
+                scorer.warmup()
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    scorer.score_shared(inputs, outputs)
+                    timings.append(time.perf_counter() - start)
+            if not np.allclose(outputs.array, expected):
+                raise RuntimeError(f"{workers}-worker results differ from the serial path.")
+            best = min(timings)
+            baseline = baseline or best
+            speedup = baseline / best
+            print(
+                f"{workers:>7} {best:>9.3f} {n_rows / best:>12,.0f} "
+                f"{speedup:>8.2f} {speedup / workers:>10.1%}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel FWI scoring.")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(args.rows, args.workers, args.repeats)
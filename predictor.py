@@ -0,0 +1,105 @@
+import pickle
+import numpy as np
+import logging
+from typing import Dict, Tuple, Union
+from results import PredictionResults
+
+logger = logging.getLogger(__name__)
+
+MODEL_PATH = "models/ridge.pkl"
+SCALER_PATH = "models/scaler.pkl"
+
+# Upper FWI bounds (inclusive) of the Low and Moderate risk levels
+RISK_THRESHOLDS = (10, 20)
+
+
+class ForestFirePredictor:
+    def __init__(self, model_path=MODEL_PATH, scaler_path=SCALER_PATH):
+        try:
+            with open(model_path, "rb") as f:
+                self.model = pickle.load(f)
+            with open(scaler_path, "rb") as f:
+                self.scaler = pickle.load(f)
+            logger.info("Model and scaler loaded successfully.")
+        except Exception as e:
+            logger.error(f"Error loading models: {e}")
+            raise
+
+    def predict(
+        self, Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
+    ) -> Dict[str, Union[str, float]]:
+        try:
+            validation = self._validate_inputs(
+                Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
+            )
+            if validation:
+                return {"error": validation}
+
+            input_data = np.array(
+                [[Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region]]
+            )
+            input_scaled = self.scaler.transform(input_data)
+            prediction = float(self.model.predict(input_scaled)[0])
+            level, color, recommendations = self._get_risk_assessment(prediction)
+
+            return {
+                "prediction": prediction,
+                "risk_level": level,
+                "color": color,
+                "recommendations": recommendations,
+            }
+        except Exception as e:
+            logger.error(f"Prediction error: {e}")
+            return {"error": str(e)}
+
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        # Vectorized scoring of an (n, 9) matrix in predict() argument order; no range validation
+        return self.model.predict(self.scaler.transform(features))
+
+    def predict_many(self, features: np.ndarray) -> PredictionResults:
+        return PredictionResults.from_fwi(
+            self.predict_batch(features), self._get_risk_assessment, RISK_THRESHOLDS
+        )
+
+    def _validate_inputs(
+        self, Temperature, RH, Ws, Rain, FFMC, DMC, ISI, Classes, Region
+    ) -> str:
+        if not (22 <= Temperature <= 42):
+            return "Temperature must be between 22°C and 42°C."
+        if not (21 <= RH <= 90):
+            return "Relative Humidity must be between 21% and 90%."
+        if not (6 <= Ws <= 29):
+            return "Wind Speed must be between 6 and 29 km/h."
+        if not (0 <= Rain <= 16.8):
+            return "Rain must be between 0 and 16.8 mm."
+        if not (28.6 <= FFMC <= 92.5):
+            return "FFMC must be between 28.6 and 92.5."
+        if not (1.1 <= DMC <= 65.9):
+            return "DMC must be between 1.1 and 65.9."
+        if not (0 <= ISI <= 18.5):
+            return "ISI must be between 0 and 18.5."
+        if Classes not in [0, 1]:
+            return "Class must be 0 (No Fire) or 1 (Fire)."
+        if Region not in [0, 1]:
+            return "Region must be 0 (Bejaia) or 1 (Sidi-Bel Abbes)."
+        return ""
+
+    def _get_risk_assessment(self, fwi: float) -> Tuple[str, str, str]:
+        if fwi <= RISK_THRESHOLDS[0]:
+            return (
+                "Low Risk",
+                "#d4edd8",  # Slightly deeper green for better contrast
+                "• Regular monitoring recommended<br>• Standard fire prevention measures sufficient<br>• Good conditions for controlled burns if needed",
+            )
+        elif fwi <= RISK_THRESHOLDS[1]:
+            return (
+                "Moderate Risk",
+                "#fff0b3",  # Warmer yellow for better visibility
+                "• Enhanced monitoring required<br>• Ensure fire breaks are maintained<br>• Review fire response procedures<br>• Avoid unnecessary burning activities",
+            )
+        else:
+            return (
+                "High Risk Level",
+                "#ffd6d6",  # Slightly warmer red for better appeal
+                "• Constant monitoring required<br>• All burning activities should be prohibited<br>• Emergency response teams should be on standby<br>• Public warning may be necessary<br>• Implement additional fire prevention measures",
+            )
@@ -0,0 +1,88 @@
+import numpy as np
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+
+class PredictionResults:
+    """Columnar batch of predictions.
+
+    FWI values are stored as a float32 array and the risk class as a uint8 code into
+    a lookup table holding each level/color/recommendations string once. Integer
+    indexing materializes a row dict with the keys `ForestFirePredictor.predict`
+    returns, with two differences: "prediction" is the float32-rounded value, and
+    rows are not range-validated, so there is no "error" key. Slices, masks and
+    index arrays return a new `PredictionResults`.
+    """
+
+    def __init__(
+        self,
+        fwi: np.ndarray,
+        risk_code: np.ndarray,
+        risk_table: Sequence[Tuple[str, str, str]],
+    ):
+        self.fwi = np.asarray(fwi, dtype=np.float32)
+        self.risk_code = np.asarray(risk_code, dtype=np.uint8)
+        self.risk_table = list(risk_table)
+        if self.fwi.shape != self.risk_code.shape:
+            raise ValueError("fwi and risk_code must have the same shape.")
+
+    @classmethod
+    def from_fwi(
+        cls,
+        fwi: np.ndarray,
+        assess: Callable[[float], Tuple[str, str, str]],
+        thresholds: Sequence[float],
+    ) -> "PredictionResults":
+        # Bucket i covers (thresholds[i-1], thresholds[i]]; its upper bound is a representative value
+        risk_table = [assess(t) for t in thresholds] + [assess(float("inf"))]
+        # Bucket the stored float32 values so each row's level matches its own prediction
+        fwi = np.asarray(fwi, dtype=np.float32)
+        risk_code = np.digitize(fwi, thresholds, right=True).astype(np.uint8)
+        return cls(fwi, risk_code, risk_table)
+
+    @property
+    def risk_levels(self) -> List[str]:
+        return [level for level, _, _ in self.risk_table]
+
+    def __len__(self) -> int:
+        return len(self.fwi)
+
+    def __getitem__(
+        self, key: Any
+    ) -> Union[Dict[str, Union[str, float]], "PredictionResults"]:
+        if not isinstance(key, (int, np.integer)):
+            return PredictionResults(self.fwi[key], self.risk_code[key], self.risk_table)
+        level, color, recommendations = self.risk_table[self.risk_code[key]]
+        return {
+            "prediction": float(self.fwi[key]),
+            "risk_level": level,
+            "color": color,
+            "recommendations": recommendations,
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Union[str, float]]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_numpy(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.fwi, self.risk_code
+
+    def to_arrow(self):
+        """Return a pyarrow Table; numeric buffers are shared, strings are dictionary-encoded."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow() requires pyarrow to be installed.") from e
+
+        codes = pa.array(self.risk_code)
+        columns = zip(*self.risk_table)
+        return pa.table(
+            {
+                "prediction": pa.array(self.fwi),
+                **{
+                    name: pa.DictionaryArray.from_arrays(codes, pa.array(values))
+                    for name, values in zip(
+                        ("risk_level", "color", "recommendations"), columns
+                    )
+                },
+            }
+        )
@@ -0,0 +1,103 @@
+import json
+import pytest
+
+pytest.importorskip("dotenv")
+
+import deploy
+from deploy import BUNDLE_FILES, MANIFEST_NAME, DirectoryTarget, HubTarget
+
+
+class FakeTarget:
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.pushes = []
+
+    def read_manifest(self):
+        return self.manifest
+
+    def push(self, bundle_dir, changed, removed):
+        self.pushes.append((changed, removed))
+
+
+@pytest.fixture
+def src(tmp_path):
+    src = tmp_path / "src"
+    for rel in BUNDLE_FILES + ["demo1.PNG", "notebooks/Model Training.ipynb"]:
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel).write_text(f"contents of {rel}")
+    return src
+
+
+def test_directory_deploy_is_incremental(src, tmp_path):
+    space = tmp_path / "space"
+    build = tmp_path / "build"
+    target = DirectoryTarget(space)
+
+    changed, removed = deploy.deploy(target, src, build)
+    assert changed == sorted(BUNDLE_FILES) and removed == []
+    deployed = [p.relative_to(space).as_posix() for p in space.rglob("*") if p.is_file()]
+    assert sorted(deployed) == sorted(BUNDLE_FILES + [MANIFEST_NAME])
+
+    assert deploy.deploy(target, src, build) == ([], [])
+
+    (src / "app.py").write_text("edited")
+    assert deploy.deploy(target, src, build) == (["app.py"], [])
+    assert (space / "app.py").read_text() == "edited"
+    assert deploy.deploy(target, src, build) == ([], [])
+
+
+def test_removed_files_are_pushed(src, tmp_path):
+    manifest = deploy.build_bundle(src, tmp_path / "build")
+    target = FakeTarget({**manifest, "demo1.PNG": "abc"})
+
+    assert deploy.deploy(target, src, tmp_path / "build") == ([], ["demo1.PNG"])
+    assert target.pushes == [([], ["demo1.PNG"])]
+
+
+def test_hub_without_manifest_deletes_legacy_files(src, tmp_path, monkeypatch):
+    hub = pytest.importorskip("huggingface_hub")
+    from huggingface_hub.utils import EntryNotFoundError
+
+    def missing_manifest(**kwargs):
+        raise EntryNotFoundError("404: manifest.json not found")
+
+    class FakeApi:
+        token = None
+
+        def list_repo_files(self, repo_id, repo_type):
+            return [".gitattributes", "app.py", "demo1.PNG", MANIFEST_NAME, "notebooks/EDA.ipynb"]
+
+        def create_commit(self, operations, **kwargs):
+            self.operations = operations
+
+    monkeypatch.setattr(hub, "hf_hub_download", missing_manifest)
+    api = FakeApi()
+    changed, removed = deploy.deploy(HubTarget(api, "user/space"), src, tmp_path / "build")
+
+    assert changed == sorted(BUNDLE_FILES)
+    assert removed == ["demo1.PNG", "notebooks/EDA.ipynb"]
+    deleted = [op.path_in_repo for op in api.operations if type(op).__name__ == "CommitOperationDelete"]
+    assert deleted == removed
+    with open(tmp_path / "build" / MANIFEST_NAME) as f:
+        assert set(json.load(f)) == set(BUNDLE_FILES)
+
+
+def test_hub_unreachable_does_not_clean_up(src, tmp_path, monkeypatch):
+    hub = pytest.importorskip("huggingface_hub")
+    from huggingface_hub.utils import LocalEntryNotFoundError
+
+    def offline(**kwargs):
+        raise LocalEntryNotFoundError("Connection error and no cached manifest.json")
+
+    class FakeApi:
+        token = None
+
+        def list_repo_files(self, repo_id, repo_type):
+            raise AssertionError("legacy cleanup must not run when the Hub is unreachable")
+
+        def create_commit(self, operations, **kwargs):
+            raise AssertionError("nothing may be pushed when the Hub is unreachable")
+
+    monkeypatch.setattr(hub, "hf_hub_download", offline)
+    with pytest.raises(LocalEntryNotFoundError):
+        deploy.deploy(HubTarget(FakeApi(), "user/space"), src, tmp_path / "build")
@@ -0,0 +1,70 @@
+import pickle
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+
+from parallel_scoring import ParallelScorer, shard_bounds, synthetic_features
+from predictor import ForestFirePredictor
+
+
+class FailingScaler:
+    def transform(self, X):
+        # Raise while this frame still references the shared-memory slice
+        raise ValueError(f"cannot scale {X.shape[0]} rows")
+
+
+@pytest.fixture(scope="module")
+def model_paths(tmp_path_factory):
+    # Small stand-in for models/*.pkl, which are Git LFS pointers in a plain checkout
+    features = synthetic_features(200, seed=1)
+    target = features @ np.linspace(-1, 1, features.shape[1]) + 5
+    scaler = StandardScaler().fit(features)
+    model = Ridge().fit(scaler.transform(features), target)
+
+    root = tmp_path_factory.mktemp("models")
+    paths = (str(root / "ridge.pkl"), str(root / "scaler.pkl"))
+    for obj, path in zip((model, scaler), paths):
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+    return paths
+
+
+@pytest.mark.parametrize("n_rows, n_shards", [(0, 4), (3, 8), (10, 3), (1001, 16)])
+def test_shard_bounds_cover_rows_exactly(n_rows, n_shards):
+    bounds = shard_bounds(n_rows, n_shards)
+    assert len(bounds) <= n_shards
+    assert all(start < stop for start, stop in bounds)
+    covered = [i for start, stop in bounds for i in range(start, stop)]
+    assert covered == list(range(n_rows))
+
+
+def test_parallel_matches_serial(model_paths):
+    features = synthetic_features(1000, seed=2)
+    expected = ForestFirePredictor(*model_paths).predict_batch(features)
+
+    with ParallelScorer(2, model_path=model_paths[0], scaler_path=model_paths[1]) as scorer:
+        np.testing.assert_allclose(scorer.score(features), expected, rtol=1e-12)
+        assert scorer.score(features[:0]).shape == (0,)
+
+
+def test_worker_error_reaches_caller(model_paths):
+    features = synthetic_features(50, seed=3)
+    features[7, 0] = np.nan
+
+    with ParallelScorer(2, model_path=model_paths[0], scaler_path=model_paths[1]) as scorer:
+        with pytest.raises(ValueError, match="NaN"):
+            scorer.score(features)
+
+
+def test_worker_error_is_not_masked_by_close(model_paths, tmp_path):
+    scaler_path = str(tmp_path / "scaler.pkl")
+    with open(scaler_path, "wb") as f:
+        pickle.dump(FailingScaler(), f)
+
+    with ParallelScorer(2, model_path=model_paths[0], scaler_path=scaler_path) as scorer:
+        with pytest.raises(ValueError, match="cannot scale"):
+            scorer.score(synthetic_features(20))
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from predictor import RISK_THRESHOLDS, ForestFirePredictor
+from results import PredictionResults
+
+# _get_risk_assessment does not touch the loaded model, so skip loading the pickles
+assess = ForestFirePredictor.__new__(ForestFirePredictor)._get_risk_assessment
+
+FWI = np.array(
+    [0.0, 9.99, 10.0, 10.01, 19.99, 20.0, 20.01, 35.0, np.nan, -np.inf, np.inf]
+    # Just above a threshold in float64 but equal to it once stored as float32
+    + [np.nextafter(10, 11), np.nextafter(20, 21)]
+)
+
+
+@pytest.fixture
+def results():
+    return PredictionResults.from_fwi(FWI, assess, RISK_THRESHOLDS)
+
+
+def test_from_fwi_buckets_match_risk_assessment(results):
+    assert results.fwi.dtype == np.float32
+    assert results.risk_code.dtype == np.uint8
+    assert len(results.risk_table) == 3
+    for row in results:
+        assert (row["risk_level"], row["color"], row["recommendations"]) == assess(row["prediction"])
+    assert results[-2]["prediction"] == 10.0 and results[-2]["risk_level"] == assess(10.0)[0]
+    assert results[-1]["prediction"] == 20.0 and results[-1]["risk_level"] == assess(20.0)[0]
+
+
+def test_row_prediction_is_float32_value(results):
+    assert results[1]["prediction"] == float(np.float32(9.99))
+    assert [row["prediction"] for row in results][:2] == [0.0, float(np.float32(9.99))]
+
+
+def test_non_scalar_keys_return_results(results):
+    sliced = results[2:5]
+    assert isinstance(sliced, PredictionResults)
+    np.testing.assert_array_equal(sliced.risk_code, results.risk_code[2:5])
+    assert sliced[0] == results[2]
+
+    high = results[results.risk_code == 2]
+    assert {row["risk_level"] for row in high} == {assess(35.0)[0]}
+    assert len(results[np.array([0, 7])]) == 2
+
+
+def test_to_arrow_dictionary_encodes_text(results):
+    pa = pytest.importorskip("pyarrow")
+    table = results.to_arrow()
+    assert table.column("prediction").type == pa.float32()
+    assert table.column("risk_level").type.index_type == pa.uint8()
+    assert table.column("risk_level").to_pylist() == [row["risk_level"] for row in results]